@@ -4,6 +4,7 @@
 
 from . import err, msg
 from .errors import *
+from .event_loop import *
 from .id import *
 from .message import *
 from .session import *
@@ -22,6 +22,9 @@ class ArgsMixin:
 
     def __repr__(self) -> str:
         arg_str = ", ".join(map(repr, self.args))
+        if not self.kwargs:
+            return f"{type(self).__qualname__}({arg_str})"
+
         kwarg_str = ", ".join(f"{key} = {value!r}" for key, value in self.kwargs.items())
         if kwarg_str and arg_str:
             join_str = ", "
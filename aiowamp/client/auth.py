@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import base64
+import binascii
 import hashlib
 import hmac
 import logging
-from typing import ClassVar, Dict, Iterator, Mapping, Optional, Union
+import threading
+from typing import Any, ClassVar, Dict, Iterator, Mapping, Optional, Tuple, Union
 
 import aiowamp
 from aiowamp.msg import Authenticate as AuthenticateMsg
@@ -172,16 +175,10 @@ class AuthKeyring(AuthKeyringABC):
                 continue
 
             for key, value in m_auth_extra.items():
-                try:
-                    existing_value = auth_extra[key]
-                except KeyError:
-                    pass
-                else:
-                    if existing_value != value:
-                        raise ValueError(f"{method} provides auth extra {key} = {value!r}, "
-                                         f"but the key is already set by another method as {existing_value!r}")
-
-                auth_extra[key] = value
+                existing_value = auth_extra.setdefault(key, value)
+                if existing_value != value:
+                    raise ValueError(f"{method} provides auth extra {key} = {value!r}, "
+                                     f"but the key is already set by another method as {existing_value!r}")
 
         self.__auth_methods = auth_methods
 
@@ -201,6 +198,15 @@ class AuthKeyring(AuthKeyringABC):
     def __iter__(self) -> Iterator[str]:
         return iter(self.__auth_methods)
 
+    # Mapping implements these by calling __getitem__, delegating to the dict
+    # directly avoids the extra call and the exception handling.
+
+    def __contains__(self, method: object) -> bool:
+        return method in self.__auth_methods
+
+    def get(self, method: str, default: Any = None) -> Any:
+        return self.__auth_methods.get(method, default)
+
     @property
     def auth_id(self) -> Optional[str]:
         return self.__auth_id
@@ -221,10 +227,18 @@ class CRAuth(AuthMethodABC):
     """
     method_name = "wampcra"
 
-    __slots__ = ("secret",)
+    __slots__ = ("__secret", "__secret_bytes",
+                 "__pbkdf2_cache", "__pbkdf2_locks", "__pbkdf2_lock",
+                 "__hmac_key", "__hmac_proto")
 
-    secret: str
-    """Secret to use for authentication."""
+    __secret: str
+    __secret_bytes: bytes
+    __pbkdf2_cache: Dict[Tuple[str, int, int], bytes]
+    __pbkdf2_locks: Dict[Tuple[str, int, int], threading.Lock]
+    __pbkdf2_lock: threading.Lock
+    """Guards `__pbkdf2_locks`, never held during a key derivation."""
+    __hmac_key: Optional[bytes]
+    __hmac_proto: Optional["hmac.HMAC"]
 
     def __init__(self, secret: str) -> None:
         """Initialise the auth method.
@@ -232,11 +246,26 @@ class CRAuth(AuthMethodABC):
         Args:
             secret: Secret to use.
         """
+        self.__pbkdf2_lock = threading.Lock()
         self.secret = secret
 
     def __repr__(self) -> str:
         return f"{type(self).__qualname__}({self.secret!r})"
 
+    @property
+    def secret(self) -> str:
+        """Secret to use for authentication."""
+        return self.__secret
+
+    @secret.setter
+    def secret(self, secret: str) -> None:
+        self.__secret = secret
+        self.__secret_bytes = secret.encode()
+        self.__pbkdf2_cache = {}
+        self.__pbkdf2_locks = {}
+        self.__hmac_key = None
+        self.__hmac_proto = None
+
     @property
     def requires_auth_id(self) -> bool:
         return True
@@ -245,41 +274,87 @@ class CRAuth(AuthMethodABC):
     def auth_extra(self) -> None:
         return None
 
-    def pbkdf2_hmac(self, salt: str, key_len: int, iterations: int) -> bytes:
-        """Derive the token using the pdkdf2 scheme.
+    def pbkdf2_hmac(self, salt: str, iterations: int, key_len: int) -> bytes:
+        """Derive the key using the pdkdf2 scheme.
 
         Args:
             salt: Salt
-            key_len: Key length
             iterations: Amount of iterations
+            key_len: Key length
 
         Returns:
-            Generated token bytes.
+            Base64 encoded derived key, which WAMP-CRA uses as the secret.
+
+        Notes:
+            The derived keys are cached so that re-authenticating with the same
+            parameters (ex: when reconnecting) doesn't derive the key again.
+            This method is thread-safe, concurrent calls with the same
+            parameters only derive the key once. Calls with different
+            parameters don't wait for each other.
         """
-        return hashlib.pbkdf2_hmac("sha256", self.secret, salt, iterations, key_len)
+        cache_key = (salt, iterations, key_len)
+        # bind them now, the secret might be changed while deriving.
+        cache = self.__pbkdf2_cache
+        secret = self.__secret_bytes
+
+        try:
+            return cache[cache_key]
+        except KeyError:
+            pass
+
+        with self.__pbkdf2_lock:
+            locks = self.__pbkdf2_locks
+            key_lock = locks.get(cache_key)
+            if key_lock is None:
+                key_lock = locks[cache_key] = threading.Lock()
+
+        with key_lock:
+            try:
+                return cache[cache_key]
+            except KeyError:
+                pass
+
+            key = hashlib.pbkdf2_hmac("sha256", secret, salt.encode(), iterations, key_len)
+            key = cache[cache_key] = base64.b64encode(key)
+
+        return key
+
+    def __sign(self, secret: bytes, challenge_str: str) -> str:
+        # keying the hmac costs two hash compressions, keep a keyed prototype
+        # for the last secret and copy it instead.
+        proto = self.__hmac_proto
+        if proto is None or self.__hmac_key != secret:
+            proto = self.__hmac_proto = hmac.new(secret, digestmod=hashlib.sha256)
+            self.__hmac_key = secret
+
+        h = proto.copy()
+        h.update(challenge_str.encode())
+        return binascii.b2a_base64(h.digest(), newline=False).decode("ascii")
 
     async def authenticate(self, challenge: aiowamp.msg.Challenge) -> aiowamp.msg.Authenticate:
         extra = challenge.extra
 
-        try:
-            challenge_str: str = extra["challenge"]
-        except KeyError:
-            raise KeyError("challenge didn't provide 'challenge' string to sign") from None
+        challenge_str: Optional[str] = extra.get("challenge")
+        if challenge_str is None:
+            raise KeyError("challenge didn't provide 'challenge' string to sign")
 
-        try:
-            salt: str = extra["salt"]
-            key_len: int = extra["keylen"]
-            iterations: int = extra["iterations"]
-        except KeyError:
+        salt: Optional[str] = extra.get("salt")
+        key_len: Optional[int] = extra.get("keylen")
+        iterations: Optional[int] = extra.get("iterations")
+        if salt is None or key_len is None or iterations is None:
             log.info("%s: using secret directly", self)
-            secret = self.secret
+            secret = self.__secret_bytes
         else:
-            log.info("%s: deriving secret from salted password", self)
-            secret = self.pbkdf2_hmac(salt, iterations, key_len)
+            derived = self.__pbkdf2_cache.get((salt, iterations, key_len))
+            if derived is None:
+                log.info("%s: deriving secret from salted password", self)
+                # key derivation can take a while, don't block the event loop.
+                loop = asyncio.get_running_loop()
+                derived = await loop.run_in_executor(None, self.pbkdf2_hmac, salt, iterations, key_len)
+
+            secret = derived
 
-        digest = hmac.digest(secret, challenge_str, hashlib.sha256)
-        signature = base64.b64encode(digest).encode()
-        return aiowamp.msg.Authenticate(signature, {})
+        return aiowamp.msg.Authenticate(self.__sign(secret, challenge_str), {})
 
 
 class TicketAuth(AuthMethodABC):
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import bisect
-from typing import Any, Container, Iterable, List, Optional, Set, Type, TypeVar, Union
+from typing import Any, Container, Iterable, Optional, Set, Type, TypeVar, Union
 
 import aiowamp
 
 __all__ = ["BlackWhiteList"]
 
 T = TypeVar("T")
+BWListT = TypeVar("BWListT", bound="BlackWhiteList")
 
 BWItemType = Union[int, str]
 
@@ -29,7 +29,9 @@ class BlackWhiteList(Container[BWItemType]):
     bwlist is also a container (i.e. support `x in bwlist`), it returns whether
     the given key will receive the event with the current constraints.
 
-    bwlist will keep the constraint lists in ascending order.
+    The constraints are stored as sets so that membership checks don't depend
+    on the number of constraints. `to_options` converts them to lists in
+    ascending order.
 
     Notes:
         bwlist assumes that the set of auth ids is distinct from the set of
@@ -38,24 +40,24 @@ class BlackWhiteList(Container[BWItemType]):
     __slots__ = ("excluded_ids", "excluded_auth_ids", "excluded_auth_roles",
                  "eligible_ids", "eligible_auth_ids", "eligible_auth_roles")
 
-    excluded_ids: Optional[List[int]]
+    excluded_ids: Optional[Set[int]]
     """Excluded session ids.
     
-    Only subscribers whose session id IS NOT in this list will receive the event.
+    Only subscribers whose session id IS NOT in this set will receive the event.
     """
-    excluded_auth_ids: Optional[List[str]]
+    excluded_auth_ids: Optional[Set[str]]
     """Excluded auth ids."""
-    excluded_auth_roles: Optional[List[str]]
+    excluded_auth_roles: Optional[Set[str]]
     """Excluded auth roles."""
 
-    eligible_ids: Optional[List[int]]
+    eligible_ids: Optional[Set[int]]
     """Eligible session ids.
     
-    Only subscribers whose session id IS in this list will receive the event.
+    Only subscribers whose session id IS in this set will receive the event.
     """
-    eligible_auth_ids: Optional[List[str]]
+    eligible_auth_ids: Optional[Set[str]]
     """Eligible auth ids."""
-    eligible_auth_roles: Optional[List[str]]
+    eligible_auth_roles: Optional[Set[str]]
     """Eligible auth roles."""
 
     def __init__(self, *,
@@ -68,8 +70,7 @@ class BlackWhiteList(Container[BWItemType]):
                  ) -> None:
         """Create a new bwlist.
 
-        The given iterables are converted into lists, sorted, and
-        duplicates are removed.
+        The given iterables are converted into sets.
 
         Args:
             excluded_ids: Session IDs to exclude.
@@ -80,21 +81,21 @@ class BlackWhiteList(Container[BWItemType]):
             eligible_auth_ids: Eligible auth IDs.
             eligible_auth_roles: Eligible auth roles.
         """
-        self.excluded_ids = unique_list_or_none(excluded_ids)
-        self.excluded_auth_ids = unique_list_or_none(excluded_auth_ids)
-        self.excluded_auth_roles = unique_list_or_none(excluded_auth_roles)
+        self.excluded_ids = unique_set_or_none(excluded_ids)
+        self.excluded_auth_ids = unique_set_or_none(excluded_auth_ids)
+        self.excluded_auth_roles = unique_set_or_none(excluded_auth_roles)
 
-        self.eligible_ids = unique_list_or_none(eligible_ids)
-        self.eligible_auth_ids = unique_list_or_none(eligible_auth_ids)
-        self.eligible_auth_roles = unique_list_or_none(eligible_auth_roles)
+        self.eligible_ids = unique_set_or_none(eligible_ids)
+        self.eligible_auth_ids = unique_set_or_none(eligible_auth_ids)
+        self.eligible_auth_roles = unique_set_or_none(eligible_auth_roles)
 
     def __str__(self) -> str:
         return f"{type(self).__qualname__}"
 
     def __bool__(self) -> bool:
         """Check if the bwlist contains any constraints."""
-        return any((self.excluded_ids, self.excluded_auth_ids, self.excluded_auth_roles,
-                    self.eligible_ids, self.eligible_auth_ids, self.eligible_auth_roles))
+        return bool(self.excluded_ids or self.excluded_auth_ids or self.excluded_auth_roles or
+                    self.eligible_ids or self.eligible_auth_ids or self.eligible_auth_roles)
 
     def __contains__(self, receiver: Any) -> bool:
         """Check if the receiver would receive the event.
@@ -106,7 +107,22 @@ class BlackWhiteList(Container[BWItemType]):
             `True` if the receiver is eligible and not excluded, `False`
             otherwise.
         """
-        return self.is_eligible(receiver) and not self.is_excluded(receiver)
+        # same as is_eligible and not is_excluded, inlined because brokers run
+        # this for every subscriber.
+        if isinstance(receiver, str):
+            roles, auth_ids = self.eligible_auth_roles, self.eligible_auth_ids
+            if not (roles is None or receiver in roles or auth_ids is None or receiver in auth_ids):
+                return False
+
+            roles, auth_ids = self.excluded_auth_roles, self.excluded_auth_ids
+            return (roles is None or receiver not in roles) and (auth_ids is None or receiver not in auth_ids)
+
+        session_ids = self.eligible_ids
+        if session_ids is not None and receiver not in session_ids:
+            return False
+
+        session_ids = self.excluded_ids
+        return session_ids is None or receiver not in session_ids
 
     def is_excluded(self, receiver: BWItemType) -> bool:
         """Check if the receiver is excluded.
@@ -119,10 +135,11 @@ class BlackWhiteList(Container[BWItemType]):
             `False` otherwise.
         """
         if isinstance(receiver, str):
-            return contains_if_not_none(self.excluded_auth_roles, receiver, False) or \
-                   contains_if_not_none(self.excluded_auth_ids, receiver, False)
+            roles, auth_ids = self.excluded_auth_roles, self.excluded_auth_ids
+            return (roles is not None and receiver in roles) or (auth_ids is not None and receiver in auth_ids)
 
-        return contains_if_not_none(self.excluded_ids, receiver, False)
+        session_ids = self.excluded_ids
+        return session_ids is not None and receiver in session_ids
 
     def is_eligible(self, receiver: BWItemType) -> bool:
         """Check if the receiver is eligible.
@@ -135,10 +152,11 @@ class BlackWhiteList(Container[BWItemType]):
             `False` otherwise.
         """
         if isinstance(receiver, str):
-            return contains_if_not_none(self.eligible_auth_roles, receiver, True) or \
-                   contains_if_not_none(self.eligible_auth_ids, receiver, True)
+            roles, auth_ids = self.eligible_auth_roles, self.eligible_auth_ids
+            return roles is None or receiver in roles or auth_ids is None or receiver in auth_ids
 
-        return contains_if_not_none(self.eligible_ids, receiver, True)
+        session_ids = self.eligible_ids
+        return session_ids is None or receiver in session_ids
 
     def exclude_session_id(self, session_id: int) -> None:
         """Add an id to the excluded session ids.
@@ -146,7 +164,7 @@ class BlackWhiteList(Container[BWItemType]):
         Args:
             session_id: Session id to add.
         """
-        self.excluded_ids = add_optional_unique_list(self.excluded_ids, session_id)
+        self.excluded_ids = add_to_optional_set(self.excluded_ids, session_id)
 
     def exclude_auth_id(self, auth_id: str) -> None:
         """Add an id to the excluded auth ids.
@@ -154,7 +172,7 @@ class BlackWhiteList(Container[BWItemType]):
         Args:
             auth_id: Auth id to add.
         """
-        self.excluded_auth_ids = add_optional_unique_list(self.excluded_auth_ids, auth_id)
+        self.excluded_auth_ids = add_to_optional_set(self.excluded_auth_ids, auth_id)
 
     def exclude_auth_role(self, auth_role: str) -> None:
         """Add a role to the excluded auth roles.
@@ -162,7 +180,7 @@ class BlackWhiteList(Container[BWItemType]):
         Args:
             auth_role: Auth role to add.
         """
-        self.excluded_auth_roles = add_optional_unique_list(self.excluded_auth_roles, auth_role)
+        self.excluded_auth_roles = add_to_optional_set(self.excluded_auth_roles, auth_role)
 
     def unexclude(self, receiver: BWItemType) -> None:
         """Remove a receiver from the excluded receivers.
@@ -182,12 +200,13 @@ class BlackWhiteList(Container[BWItemType]):
                 return
 
             raise ValueError(f"receiver {receiver!r} is neither an excluded "
-                             f"auth id, nor an auth role") from None
+                             f"auth id, nor an auth role")
 
-        try:
-            self.excluded_ids.remove(receiver)
-        except (TypeError, ValueError):
-            raise ValueError(f"session id {receiver!r} isn't excluded") from None
+        ids = self.excluded_ids
+        if ids is None or receiver not in ids:
+            raise ValueError(f"session id {receiver!r} isn't excluded")
+
+        ids.remove(receiver)
 
     def allow_session_id(self, session_id: int) -> None:
         """Add an id to the eligible ids.
@@ -195,7 +214,7 @@ class BlackWhiteList(Container[BWItemType]):
         Args:
             session_id: Session id to add
         """
-        self.eligible_ids = add_optional_unique_list(self.eligible_ids, session_id)
+        self.eligible_ids = add_to_optional_set(self.eligible_ids, session_id)
 
     def allow_auth_id(self, auth_id: str) -> None:
         """Add an id to the eligible auth ids.
@@ -203,7 +222,7 @@ class BlackWhiteList(Container[BWItemType]):
         Args:
             auth_id: Auth id to add.
         """
-        self.eligible_auth_ids = add_optional_unique_list(self.eligible_auth_ids, auth_id)
+        self.eligible_auth_ids = add_to_optional_set(self.eligible_auth_ids, auth_id)
 
     def allow_auth_role(self, auth_role: str) -> None:
         """Add a role to the eligible auth roles.
@@ -211,7 +230,7 @@ class BlackWhiteList(Container[BWItemType]):
         Args:
             auth_role: Auth role to add.
         """
-        self.eligible_auth_roles = add_optional_unique_list(self.eligible_auth_roles, auth_role)
+        self.eligible_auth_roles = add_to_optional_set(self.eligible_auth_roles, auth_role)
 
     def disallow(self, receiver: BWItemType) -> None:
         """Remove a receiver from the eligible receivers.
@@ -231,12 +250,13 @@ class BlackWhiteList(Container[BWItemType]):
                 return
 
             raise ValueError(f"receiver {receiver!r} is neither an eligible "
-                             f"auth id, nor an auth role") from None
+                             f"auth id, nor an auth role")
+
+        ids = self.eligible_ids
+        if ids is None or receiver not in ids:
+            raise ValueError(f"session id {receiver!r} isn't eligible")
 
-        try:
-            self.eligible_ids.remove(receiver)
-        except (TypeError, ValueError):
-            raise ValueError(f"session id {receiver!r} isn't eligible") from None
+        ids.remove(receiver)
 
     def to_options(self, options: aiowamp.WAMPDict = None) -> aiowamp.WAMPDict:
         """Convert the bwlist to WAMP options.
@@ -253,23 +273,23 @@ class BlackWhiteList(Container[BWItemType]):
         options = options or {}
 
         if self.excluded_ids is not None:
-            options["exclude"] = self.excluded_ids
+            options["exclude"] = sorted(self.excluded_ids)
         if self.excluded_auth_ids is not None:
-            options["exclude_authid"] = self.excluded_auth_ids
+            options["exclude_authid"] = sorted(self.excluded_auth_ids)
         if self.excluded_auth_roles is not None:
-            options["exclude_authrole"] = self.excluded_auth_roles
+            options["exclude_authrole"] = sorted(self.excluded_auth_roles)
 
         if self.eligible_ids is not None:
-            options["eligible"] = self.eligible_ids
+            options["eligible"] = sorted(self.eligible_ids)
         if self.eligible_auth_ids is not None:
-            options["eligible_authid"] = self.eligible_auth_ids
+            options["eligible_authid"] = sorted(self.eligible_auth_ids)
         if self.eligible_auth_roles is not None:
-            options["eligible_authrole"] = self.eligible_auth_roles
+            options["eligible_authrole"] = sorted(self.eligible_auth_roles)
 
         return options
 
     @classmethod
-    def from_options(cls: Type[T], options: aiowamp.WAMPDict) -> T:
+    def from_options(cls: Type[BWListT], options: aiowamp.WAMPDict) -> BWListT:
         """Create a bwlist from WAMP options.
 
         Args:
@@ -278,94 +298,68 @@ class BlackWhiteList(Container[BWItemType]):
         Returns:
             New bwlist with the constraints from the options.
         """
-        return cls(
-            excluded_ids=options.get("exclude"),
-            excluded_auth_ids=options.get("exclude_authid"),
-            excluded_auth_roles=options.get("exclude_authrole"),
+        # bypass __init__, its keyword arguments would only be unpacked again.
+        bwlist = cls.__new__(cls)
+        get = options.get
 
-            eligible_ids=options.get("eligible"),
-            eligible_auth_ids=options.get("eligible_authid"),
-            eligible_auth_roles=options.get("eligible_authrole"),
-        )
+        bwlist.excluded_ids = unique_set_or_none(get("exclude"))
+        bwlist.excluded_auth_ids = unique_set_or_none(get("exclude_authid"))
+        bwlist.excluded_auth_roles = unique_set_or_none(get("exclude_authrole"))
 
+        bwlist.eligible_ids = unique_set_or_none(get("eligible"))
+        bwlist.eligible_auth_ids = unique_set_or_none(get("eligible_authid"))
+        bwlist.eligible_auth_roles = unique_set_or_none(get("eligible_authrole"))
 
-def contains_if_not_none(c: Optional[Container[T]], v: T, default: bool) -> bool:
-    """Check if the optional container contains a value.
+        return bwlist
 
-    Args:
-        c: Optional container.
-        v: Value to check.
-        default: Default value to return if the container is `None`
 
-    Returns:
-        Whether the value is in the container, or the default value if the
-        container is `None`.
-    """
-    if c is None:
-        return default
-
-    return v in c
-
-
-def unique_list_or_none(it: Optional[Iterable[T]]) -> Optional[List[T]]:
-    """Convert the optional iterable into an optional unique list.
+def unique_set_or_none(it: Optional[Iterable[T]]) -> Optional[Set[T]]:
+    """Convert the optional iterable into an optional set.
 
     Args:
         it: Optional iterable to convert.
 
     Returns:
-        `None` if the iterable is `None`, a list containing the unique elements
-        from the iterable in ascending order otherwise.
+        `None` if the iterable is `None`, a set containing the elements from
+        the iterable otherwise.
     """
     if it is None:
         return None
 
-    # KeysView is a subtype of set, so this should do.
-    if isinstance(it, Set):
-        return list(it)
+    return set(it)
 
-    return list(set(it))
 
-
-def add_optional_unique_list(l: Optional[List[T]], v: T) -> List[T]:
-    """Add a value to an optional list.
-
-    If the list is sorted, the value is inserted at the appropriate position.
-    If it isn't, then the position is undefined.
+def add_to_optional_set(s: Optional[Set[T]], v: T) -> Set[T]:
+    """Add a value to an optional set.
 
     Args:
-        l: List to add the value to. If `None`, a new list will be created.
+        s: Set to add the value to. If `None`, a new set will be created.
         v: Value to add.
 
     Returns:
-        List containing the value. If l is not `None`, this will be the same
-        list.
+        Set containing the value. If s is not `None`, this will be the same
+        set.
     """
-    if l is None:
-        return [v]
-
-    if v not in l:
-        bisect.insort(l, v)
+    if s is None:
+        return {v}
 
-    return v
+    s.add(v)
+    return s
 
 
-def remove_from_any(v: T, *sequences: Optional[List[T]]) -> bool:
-    """Remove the value from the first list.
+def remove_from_any(v: T, *sets: Optional[Set[T]]) -> bool:
+    """Remove the value from the first set containing it.
 
     Args:
         v: Value to remove.
-        *sequences: Optional lists to try to remove the value from.
+        *sets: Optional sets to try to remove the value from.
 
     Returns:
-        Whether the value was removed from any list.
+        Whether the value was removed from any set.
     """
-    for seq in sequences:
-        try:
-            seq.remove(v)
-        except (TypeError, KeyError):
-            pass
-        else:
+    for s in sets:
+        if s is not None and v in s:
+            s.remove(v)
             return True
 
     return False
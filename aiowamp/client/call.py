@@ -4,21 +4,24 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import collections
 import logging
-from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Type, Union
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Optional, Type, Union, cast
 
 import aiowamp
-from aiowamp import UnexpectedMessageError, is_message_type, message_as_type
+from aiowamp import UnexpectedMessageError, error_to_exception
 from aiowamp.maybe_awaitable import MaybeAwaitable, call_async_fn_background
 from aiowamp.msg import Cancel as CancelMsg, Error as ErrorMsg, Result as ResultMsg
 from .invocation import InvocationProgress, InvocationResult
-from .utils import check_message_response
 
 __all__ = ["ProgressHandler",
            "CallABC", "Call"]
 
 log = logging.getLogger(__name__)
 
+_RESULT_TYPE = ResultMsg.message_type
+_ERROR_TYPE = ErrorMsg.message_type
+
 ProgressHandler = Callable[["aiowamp.InvocationProgress"], MaybeAwaitable[Any]]
 """Type of a progress handler function.
 
@@ -120,8 +123,10 @@ class CallABC(Awaitable["aiowamp.InvocationResult"], AsyncIterator["aiowamp.Invo
 class Call(CallABC):
     __slots__ = ("session",
                  "_call_msg", "_call_sent",
+                 "__str",
                  "__cancel_mode",
-                 "__result_fut", "__progress_queue", "__progress_handler")
+                 "__result_fut",
+                 "__progress_buf", "__progress_waiter", "__progress_handler")
 
     session: aiowamp.SessionABC
     """Session used to send messages."""
@@ -129,14 +134,18 @@ class Call(CallABC):
     _call_msg: aiowamp.msg.Call
     _call_sent: bool
 
+    __str: str
+
     __cancel_mode: aiowamp.CancelMode
 
     __result_fut: asyncio.Future
-    __progress_queue: Optional[asyncio.Queue]
+    __progress_buf: Optional[Deque[aiowamp.InvocationProgress]]
+    __progress_waiter: Optional[asyncio.Future]
     __progress_handler: Optional[aiowamp.ProgressHandler]
 
     def __init__(self, session: aiowamp.SessionABC, call: aiowamp.msg.Call, *,
-                 cancel_mode: aiowamp.CancelMode) -> None:
+                 cancel_mode: aiowamp.CancelMode,
+                 loop: asyncio.AbstractEventLoop = None) -> None:
         """Initialise the call.
 
         Note that you normally shouldn't create an instance yourself, it doesn't
@@ -147,22 +156,31 @@ class Call(CallABC):
             session: Session to use to send messages.
             call: Call message that spawned the call.
             cancel_mode: Cancel mode used when cancelling the call.
+            loop: Event loop the call runs in. Defaults to the running loop.
         """
         self.session = session
         self._call_msg = call
         self._call_sent = False
 
+        # the string is used by the log messages
+        self.__str = f"Call {call.request_id}"
+
         self.__cancel_mode = cancel_mode
 
-        loop = asyncio.get_running_loop()
+        if loop is None:
+            loop = asyncio.get_running_loop()
 
         self.__result_fut = loop.create_future()
-        self.__progress_queue = None
+        self.__progress_buf = None
+        self.__progress_waiter = None
         self.__progress_handler = None
 
     def __repr__(self) -> str:
         return f"Call({self.session!r}, {self._call_msg!r})"
 
+    def __str__(self) -> str:
+        return self.__str
+
     @property
     def request_id(self) -> int:
         return self._call_msg.request_id
@@ -195,8 +213,16 @@ class Call(CallABC):
             return
 
         self.__result_fut.set_exception(e)
-        if self.__progress_queue is not None:
-            self.__progress_queue.put_nowait(None)
+        self.__wake_progress_waiter()
+
+    def __wake_progress_waiter(self) -> None:
+        waiter = self.__progress_waiter
+        if waiter is None:
+            return
+
+        self.__progress_waiter = None
+        if not waiter.done():
+            waiter.set_result(None)
 
     def __ensure_receive_progress(self) -> None:
         try:
@@ -214,7 +240,7 @@ class Call(CallABC):
             raise RuntimeError("call is explicitly unwilling to receive progress")
 
     def __handle_progress(self, progress_msg: aiowamp.msg.Result) -> None:
-        if self.__progress_handler is None and self.__progress_queue is None:
+        if self.__progress_handler is None and self.__progress_buf is None:
             # Probably best not to use a warning because one might want to ignore
             # the progress results, but still, we should inform the user somehow.
             log.info("%s: received progress but has no handler", self)
@@ -228,8 +254,9 @@ class Call(CallABC):
                                      "progress handler raised exception",
                                      progress)
 
-        if self.__progress_queue is not None:
-            self.__progress_queue.put_nowait(progress)
+        if self.__progress_buf is not None:
+            self.__progress_buf.append(progress)
+            self.__wake_progress_waiter()
 
     def handle_response(self, msg: aiowamp.MessageABC) -> bool:
         """Handle a message targeted to this call.
@@ -237,24 +264,26 @@ class Call(CallABC):
         Args:
             msg: Message received in relation to this call.
         """
-        if self.done:
+        # bypass the done property, this is called for every message.
+        result_fut = self.__result_fut
+        if result_fut.done():
             # already done, no need to handle message
             return True
 
-        result = message_as_type(msg, ResultMsg)
-        if result and result.details.get("progress"):
-            self.__handle_progress(result)
-            return False
+        msg_type = msg.message_type
+        if msg_type == _RESULT_TYPE:
+            result_msg = cast(ResultMsg, msg)
+            if result_msg.details.get("progress"):
+                self.__handle_progress(result_msg)
+                return False
 
-        if result or is_message_type(msg, ErrorMsg):
-            self.__result_fut.set_result(msg)
+            result_fut.set_result(result_msg)
+        elif msg_type == _ERROR_TYPE:
+            result_fut.set_result(msg)
         else:
-            self.__result_fut.set_exception(UnexpectedMessageError(msg, ResultMsg))
-
-        if self.__progress_queue is not None:
-            # add none to wake up
-            self.__progress_queue.put_nowait(None)
+            result_fut.set_exception(UnexpectedMessageError(msg, ResultMsg))
 
+        self.__wake_progress_waiter()
         return True
 
     async def __send_call(self) -> None:
@@ -268,23 +297,26 @@ class Call(CallABC):
         except Exception as e:
             self.__result_fut.set_exception(e)
 
-    async def __next_final(self) -> Union[aiowamp.msg.Result, aiowamp.msg.Error]:
-        if not self._call_sent:
-            await self.__send_call()
-
-        return await self.__result_fut
-
     async def result(self) -> aiowamp.InvocationResult:
+        # send and wait for the result right here, going through another
+        # coroutine for the result costs an extra frame for every call.
         try:
-            msg = await self.__next_final()
+            if not self._call_sent:
+                await self.__send_call()
+
+            msg: Union[aiowamp.msg.Result, aiowamp.msg.Error] = await self.__result_fut
         except asyncio.CancelledError:
             if not self.cancelled:
                 await self.cancel()
 
             raise
 
-        result_msg = check_message_response(msg, ResultMsg)
-        return _create_invocation_result(result_msg.args, result_msg.kwargs, result_msg.details)
+        # handle_response only ever resolves the future with a result or an
+        # error message, there's no need to check for other types again.
+        if msg.message_type == _ERROR_TYPE:
+            raise error_to_exception(cast(ErrorMsg, msg))
+
+        return _create_invocation_result(msg.args, msg.kwargs, msg.details)
 
     async def next_progress(self) -> Optional[aiowamp.InvocationProgress]:
         self.__ensure_receive_progress()
@@ -292,16 +324,25 @@ class Call(CallABC):
         if not self._call_sent:
             await self.__send_call()
 
-        if self.__progress_queue is None:
-            self.__progress_queue = asyncio.Queue()
+        buf = self.__progress_buf
+        if buf is None:
+            buf = self.__progress_buf = collections.deque()
+
+        # the waiter is woken up whenever a progress result arrives or the call
+        # completes. It's shared between all consumers, so they need to check
+        # the buffer again after waking up.
+        result_fut = self.__result_fut
+        while not buf:
+            if result_fut.done():
+                return None
+
+            waiter = self.__progress_waiter
+            if waiter is None:
+                waiter = self.__progress_waiter = result_fut.get_loop().create_future()
 
-        if self.__progress_queue.empty() and self.done:
-            return None
+            await waiter
 
-        # this depends on the fact that None is pushed to the queue.
-        # it would be nicer to use asyncio.wait, but this way is
-        # "cheaper"
-        return await self.__progress_queue.get()
+        return buf.popleft()
 
     async def cancel(self, cancel_mode: aiowamp.CancelMode = None, *,
                      options: aiowamp.WAMPDict = None) -> None:
@@ -319,7 +360,7 @@ class Call(CallABC):
 
         await self.session.send(CancelMsg(self._call_msg.request_id, options))
         try:
-            await self.__next_final()
+            await self.__result_fut
         except Exception:
             pass
 
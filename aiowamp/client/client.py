@@ -3,16 +3,16 @@
 from __future__ import annotations
 
 import abc
-import array
 import asyncio
-import contextlib
+import functools
+import inspect
 import logging
-from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Dict, MutableMapping, Optional, Tuple, \
-    TypeVar, Union
+from typing import Any, AsyncGenerator, Awaitable, Callable, ClassVar, Dict, List, MutableMapping, Optional, \
+    Sequence, Set, Tuple, Union
 
 import aiowamp
-from aiowamp import ClientClosed, IDGenerator, Interrupt, URI, exception_to_invocation_error, message_as_type
-from aiowamp.maybe_awaitable import MaybeAwaitable, call_async_fn
+from aiowamp import ClientClosed, IDGenerator, Interrupt, URI, exception_to_invocation_error
+from aiowamp.maybe_awaitable import MaybeAwaitable
 from aiowamp.msg import Call as CallMsg, Error as ErrorMsg, Event as EventMsg, Interrupt as InterruptMsg, \
     Invocation as InvocationMsg, Publish as PublishMsg, Published as PublishedMsg, Register as RegisterMsg, \
     Registered as RegisteredMsg, Subscribe as SubscribeMsg, Subscribed as SubscribedMsg, Unregister as UnregisterMsg, \
@@ -23,7 +23,7 @@ from .enum import CANCEL_KILL_NO_WAIT
 from .event import SubscriptionEvent
 from .invocation import Invocation
 from .procedure_runner import ProcedureRunnerABC, RunnerFactory, get_runner_factory
-from .utils import check_message_response
+from .utils import EMPTY_OPTIONS, check_message_response
 
 __all__ = ["InvocationHandlerResult",
            "InvocationHandler", "SubscriptionHandler",
@@ -307,7 +307,8 @@ class ClientABC(abc.ABC):
 
 class Client(ClientABC):
     __slots__ = ("session", "id_gen",
-                 "__awaiting_reply", "__ongoing_calls", "__running_procedures",
+                 "_loop",
+                 "__pending", "__running_procedures",
                  "__procedure_ids", "__procedures",
                  "__sub_ids", "__sub_handlers")
 
@@ -316,15 +317,21 @@ class Client(ClientABC):
     id_gen: aiowamp.IDGeneratorABC
     """ID generator used to generate the client ids."""
 
-    __awaiting_reply: Dict[int, asyncio.Future]
-    __ongoing_calls: Dict[int, aiowamp.Call]
+    _loop: asyncio.AbstractEventLoop
+
+    __pending: Dict[int, Union[asyncio.Future, aiowamp.Call]]
+    """Requests waiting for a response.
+
+    Contains either a future which receives the response message or an
+    ongoing call. Request ids are unique across both.
+    """
     __running_procedures: Dict[int, ProcedureRunnerABC]
 
-    __procedure_ids: Dict[str, array.ArrayType]
+    __procedure_ids: Dict[str, Set[int]]
     __procedures: Dict[int, Tuple[RunnerFactory, aiowamp.URI]]
 
-    __sub_ids: Dict[str, array.ArrayType]
-    __sub_handlers: Dict[int, Tuple[aiowamp.SubscriptionHandler, aiowamp.URI]]
+    __sub_ids: Dict[str, Set[int]]
+    __sub_handlers: Dict[int, Tuple[aiowamp.SubscriptionHandler, aiowamp.URI, bool]]
 
     def __init__(self, session: aiowamp.SessionABC) -> None:
         """Initialise the client.
@@ -338,8 +345,9 @@ class Client(ClientABC):
         self.session = session
         self.id_gen = IDGenerator()
 
-        self.__awaiting_reply = {}
-        self.__ongoing_calls = {}
+        self._loop = asyncio.get_running_loop()
+
+        self.__pending = {}
         self.__running_procedures = {}
 
         self.__procedure_ids = {}
@@ -357,20 +365,20 @@ class Client(ClientABC):
         return f"{type(self).__qualname__} {self.session.session_id}"
 
     async def __handle_invocation(self, invocation_msg: aiowamp.msg.Invocation) -> None:
-        try:
-            runner_factory, uri = self.__procedures[invocation_msg.registration_id]
-        except KeyError:
+        procedure = self.__procedures.get(invocation_msg.registration_id)
+        if procedure is None:
             log.warning("%s: received invocation for unknown registration: %r", self, invocation_msg)
 
             await self.session.send(ErrorMsg(
                 InvocationMsg.message_type,
                 invocation_msg.request_id,
-                {},
+                EMPTY_OPTIONS,
                 INVALID_ARGUMENT,
                 [f"client has no procedure for registration {invocation_msg.registration_id}"]
             ))
             return
 
+        runner_factory, uri = procedure
         invocation = Invocation(self.session, self, invocation_msg, procedure=uri)
 
         try:
@@ -389,90 +397,115 @@ class Client(ClientABC):
             del self.__running_procedures[invocation.request_id]
 
     async def __handle_interrupt(self, interrupt_msg: aiowamp.msg.Interrupt) -> None:
-        try:
-            runner = self.__running_procedures[interrupt_msg.request_id]
-        except KeyError:
+        runner = self.__running_procedures.get(interrupt_msg.request_id)
+        if runner is None:
             log.info("%s: received interrupt for invocation that doesn't exist", self)
             return
 
         await runner.interrupt(Interrupt(interrupt_msg.options))
 
-    async def __handle_event(self, event_msg: aiowamp.msg.Event, handler: aiowamp.SubscriptionHandler,
-                             topic: aiowamp.URI) -> None:
-        event = SubscriptionEvent(self, event_msg, topic=topic)
-        await call_async_fn(handler, event)
+    async def __handle_event(self, event_msg: aiowamp.msg.Event) -> None:
+        sub_handler = self.__sub_handlers.get(event_msg.subscription_id)
+        if sub_handler is None:
+            log.warning("%s: received event for unknown subscription: %r", self, event_msg)
+            return
 
-    async def __handle_message(self, msg: aiowamp.MessageABC) -> None:
-        invocation = message_as_type(msg, InvocationMsg)
-        if invocation:
-            await self.__handle_invocation(invocation)
+        handler, uri, is_coro = sub_handler
+
+        event = SubscriptionEvent(self, event_msg, topic=uri)
+        res = handler(event)
+        # is_coro is determined when subscribing. Only fall back to the
+        # (slower) awaitable check for handlers which aren't coroutine
+        # functions but might still return an awaitable.
+        if is_coro or (res is not None and inspect.isawaitable(res)):
+            await res
+
+    def __handle_response(self, request_id: int, msg: aiowamp.MessageABC) -> None:
+        pending = self.__pending.get(request_id)
+        if pending is None:
+            log.warning("%s: message with unexpected request id: %r", self, msg)
             return
 
-        interrupt = message_as_type(msg, InterruptMsg)
-        if interrupt:
-            await self.__handle_interrupt(interrupt)
+        if isinstance(pending, asyncio.Future):
+            # response to another message
+            pending.set_result(msg)
+        elif pending.handle_response(msg):
+            # response to an ongoing call
+            log.debug("%s: %s done", self, pending)
+            del self.__pending[request_id]
+
+    __message_handlers: ClassVar[Dict[int, Callable[[Client, Any], Awaitable[None]]]] = {
+        InvocationMsg.message_type: __handle_invocation,
+        InterruptMsg.message_type: __handle_interrupt,
+        EventMsg.message_type: __handle_event,
+    }
+
+    async def __handle_message(self, msg: aiowamp.MessageABC) -> None:
+        handler = self.__message_handlers.get(msg.message_type)
+        if handler is not None:
+            await handler(self, msg)
             return
 
-        try:
-            request_id: int = getattr(msg, "request_id")
-        except AttributeError:
-            pass
-        else:
+        request_id = msg.request_id
+        if request_id is not None:
             # received a message with a request_id
+            self.__handle_response(request_id, msg)
 
-            try:
-                waiter = self.__awaiting_reply[request_id]
-            except KeyError:
-                pass
-            else:
-                # response to another message
+    async def _request_response(self, req_id: int, msg: aiowamp.MessageABC) -> aiowamp.MessageABC:
+        """Send a message and wait for the response.
 
-                waiter.set_result(msg)
-                return
+        Args:
+            req_id: Request id of the message.
+            msg: Message to send.
 
-            try:
-                call = self.__ongoing_calls[request_id]
-            except KeyError:
-                pass
-            else:
-                # response to an ongoing call
+        Returns:
+            The message received in response to the request.
+        """
+        fut = self._loop.create_future()
+        self.__pending[req_id] = fut
 
-                if call.handle_response(msg):
-                    log.debug("%s: %s done", self, call)
+        try:
+            await self.session.send(msg)
+            return await fut
+        finally:
+            self.__pending.pop(req_id, None)
 
-                    del self.__ongoing_calls[request_id]
+    async def _request_response_many(self, msgs: Sequence[aiowamp.MessageABC]) -> List[aiowamp.MessageABC]:
+        """Send multiple messages at once and wait for all responses.
 
-                return
+        Unlike running `_request_response` for every message, the messages are
+        written using a single `aiowamp.SessionABC.send_many` call.
 
-            log.warning("%s: message with unexpected request id: %r", self, msg)
+        Args:
+            msgs: Messages to send. Every message must have a request id.
 
-        # received event
-        event = message_as_type(msg, EventMsg)
-        if event:
-            try:
-                handler, uri = self.__sub_handlers[event.subscription_id]
-            except KeyError:
-                log.warning(f"%s: received event for unknown subscription: %r", self, event)
-            else:
-                await self.__handle_event(event, handler, uri)
+        Returns:
+            The responses in the same order as the messages.
 
-            return
+        Raises:
+            ValueError: If a message doesn't have a request id.
+        """
+        req_ids: List[int] = []
+        for msg in msgs:
+            if msg.request_id is None:
+                raise ValueError(f"message without request id: {msg!r}")
 
-    @contextlib.asynccontextmanager
-    async def _expecting_response(self, req_id: int) -> AsyncIterator[Awaitable[aiowamp.MessageABC]]:
-        loop = asyncio.get_running_loop()
-        fut = loop.create_future()
-        self.__awaiting_reply[req_id] = fut
+            req_ids.append(msg.request_id)
 
-        try:
-            yield fut
+        pending = self.__pending
+        create_future = self._loop.create_future
+
+        futs = []
+        for req_id in req_ids:
+            fut = pending[req_id] = create_future()
+            futs.append(fut)
 
-            # wait for the response to come in before removing the future,
-            # otherwise it won't receive the response.
-            await fut
+        try:
+            await self.session.send_many(msgs)
+            return await asyncio.gather(*futs)
         finally:
-            with contextlib.suppress(KeyError):
-                del self.__awaiting_reply[req_id]
+            for req_id in req_ids:
+                pending.pop(req_id, None)
 
     async def _cleanup(self) -> None:
         exc = ClientClosed()
@@ -489,13 +522,13 @@ class Client(ClientABC):
         self.__sub_handlers.clear()
         self.__sub_ids.clear()
 
-        for call in self.__ongoing_calls.values():
-            call.kill(exc)
-        self.__ongoing_calls.clear()
+        for pending in self.__pending.values():
+            if isinstance(pending, asyncio.Future):
+                pending.set_exception(exc)
+            else:
+                pending.kill(exc)
 
-        for fut in self.__awaiting_reply.values():
-            fut.set_exception(exc)
-        self.__awaiting_reply.clear()
+        self.__pending.clear()
 
     async def close(self, details: aiowamp.WAMPDict = None, *,
                     reason: str = None) -> None:
@@ -516,11 +549,12 @@ class Client(ClientABC):
         Returns:
             Tuple containing the registration ids.
         """
-        try:
-            return tuple(self.__procedure_ids[procedure])
-        except KeyError:
+        ids = self.__procedure_ids.get(procedure)
+        if ids is None:
             return ()
 
+        return tuple(ids)
+
     async def register(self, procedure: str, handler: aiowamp.InvocationHandler, *,
                        disclose_caller: bool = None,
                        match_policy: aiowamp.MatchPolicy = None,
@@ -532,43 +566,44 @@ class Client(ClientABC):
         if match_policy is not None:
             procedure_uri = URI(procedure, match_policy=match_policy)
         else:
-            procedure_uri = URI.cast(procedure)
+            procedure_uri = _uri(procedure)
+
+        uri_match_policy = procedure_uri.match_policy
+        if disclose_caller is not None or uri_match_policy is not None or invocation_policy is not None:
+            if options is None:
+                options = {}
 
-        if disclose_caller is not None:
-            options = _set_value(options, "disclose_caller", disclose_caller)
+            if disclose_caller is not None:
+                options["disclose_caller"] = disclose_caller
 
-        if procedure_uri.match_policy is not None:
-            options = _set_value(options, "match", procedure_uri.match_policy)
+            if uri_match_policy is not None:
+                options["match"] = uri_match_policy
 
-        if invocation_policy is not None:
-            options = _set_value(options, "invoke", invocation_policy)
+            if invocation_policy is not None:
+                options["invoke"] = invocation_policy
 
         req_id = next(self.id_gen)
-        async with self._expecting_response(req_id) as resp:
-            await self.session.send(RegisterMsg(
-                req_id,
-                options or {},
-                procedure_uri,
-            ))
+        resp = await self._request_response(req_id, RegisterMsg(
+            req_id,
+            options or EMPTY_OPTIONS,
+            procedure_uri,
+        ))
 
-        registered = check_message_response(await resp, RegisteredMsg)
+        registered = check_message_response(resp, RegisteredMsg)
 
         reg_id = registered.registration_id
-        _add_to_array(self.__procedure_ids, procedure_uri, reg_id)
+        _add_to_set(self.__procedure_ids, procedure_uri, reg_id)
 
         self.__procedures[reg_id] = runner, procedure_uri
 
         return reg_id
 
     async def __unregister(self, reg_id: int) -> None:
-        with contextlib.suppress(KeyError):
-            del self.__procedures[reg_id]
+        self.__procedures.pop(reg_id, None)
 
         req_id = next(self.id_gen)
-        async with self._expecting_response(req_id) as resp:
-            await self.session.send(UnregisterMsg(req_id, reg_id))
-
-        check_message_response(await resp, UnregisteredMsg)
+        resp = await self._request_response(req_id, UnregisterMsg(req_id, reg_id))
+        check_message_response(resp, UnregisteredMsg)
 
     async def unregister(self, procedure: str, registration_id: int = None) -> None:
         if registration_id is None:
@@ -577,14 +612,27 @@ class Client(ClientABC):
             except KeyError:
                 raise KeyError(f"no procedure registered for {procedure!r}") from None
 
-            await asyncio.gather(*(self.__unregister(reg_id) for reg_id in reg_ids))
+            if len(reg_ids) == 1:
+                # the common case, a single request doesn't need to be batched.
+                reg_id, = reg_ids
+                await self.__unregister(reg_id)
+                return
+
+            procedures = self.__procedures
+            for reg_id in reg_ids:
+                procedures.pop(reg_id, None)
+
+            id_gen = self.id_gen
+            resps = await self._request_response_many([UnregisterMsg(next(id_gen), reg_id) for reg_id in reg_ids])
+            for resp in resps:
+                check_message_response(resp, UnregisteredMsg)
+
             return
 
         if registration_id not in self.__procedures:
             raise KeyError(f"unknown registration id {registration_id!r}")
 
-        with contextlib.suppress(KeyError, ValueError):
-            self.__procedure_ids[procedure].remove(registration_id)
+        _remove_from_set(self.__procedure_ids, procedure, registration_id)
 
         await self.__unregister(registration_id)
 
@@ -596,18 +644,23 @@ class Client(ClientABC):
              disclose_me: bool = None,
              resource_key: str = None,
              options: aiowamp.WAMPDict = None) -> aiowamp.CallABC:
-        if receive_progress is not None:
-            options = _set_value(options, "receive_progress", receive_progress)
+        if (receive_progress is not None or call_timeout is not None
+                or disclose_me is not None or resource_key is not None):
+            if options is None:
+                options = {}
+
+            if receive_progress is not None:
+                options["receive_progress"] = receive_progress
 
-        if call_timeout is not None:
-            options = _set_value(options, "timeout", round(1e3 * call_timeout))
+            if call_timeout is not None:
+                options["timeout"] = round(1e3 * call_timeout)
 
-        if disclose_me is not None:
-            options = _set_value(options, "disclose_me", disclose_me)
+            if disclose_me is not None:
+                options["disclose_me"] = disclose_me
 
-        if resource_key is not None:
-            options = _set_value(options, "rkey", resource_key)
-            options["runmode"] = "partition"
+            if resource_key is not None:
+                options["rkey"] = resource_key
+                options["runmode"] = "partition"
 
         req_id = next(self.id_gen)
         call = Call(
@@ -615,14 +668,15 @@ class Client(ClientABC):
             CallMsg(
                 req_id,
                 options or {},
-                procedure,
-                list(args) or None,
-                kwargs,
+                _uri(procedure),
+                list(args) if args else None,
+                kwargs or None,
             ),
-            cancel_mode=cancel_mode or CANCEL_KILL_NO_WAIT
+            cancel_mode=cancel_mode or CANCEL_KILL_NO_WAIT,
+            loop=self._loop,
         )
 
-        self.__ongoing_calls[req_id] = call
+        self.__pending[req_id] = call
 
         return call
 
@@ -635,11 +689,12 @@ class Client(ClientABC):
         Returns:
             Tuple of subscription ids.
         """
-        try:
-            return tuple(self.__sub_ids[topic])
-        except KeyError:
+        ids = self.__sub_ids.get(topic)
+        if ids is None:
             return ()
 
+        return tuple(ids)
+
     async def subscribe(self, topic: str, callback: aiowamp.SubscriptionHandler, *,
                         match_policy: aiowamp.MatchPolicy = None,
                         node_key: str = None,
@@ -647,55 +702,69 @@ class Client(ClientABC):
         if match_policy is not None:
             topic_uri = URI(topic, match_policy=match_policy)
         else:
-            topic_uri = URI.cast(topic)
+            topic_uri = _uri(topic)
+
+        uri_match_policy = topic_uri.match_policy
+        if uri_match_policy or node_key is not None:
+            if options is None:
+                options = {}
 
-        if topic_uri.match_policy:
-            options = _set_value(options, "match", topic_uri.match_policy)
+            if uri_match_policy:
+                options["match"] = uri_match_policy
 
-        if node_key is not None:
-            options = _set_value(options, "nkey", node_key)
+            if node_key is not None:
+                options["nkey"] = node_key
 
         req_id = next(self.id_gen)
-        async with self._expecting_response(req_id) as resp:
-            await self.session.send(SubscribeMsg(
-                req_id,
-                options or {},
-                topic_uri,
-            ))
+        resp = await self._request_response(req_id, SubscribeMsg(
+            req_id,
+            options or EMPTY_OPTIONS,
+            topic_uri,
+        ))
 
-        subscribed = check_message_response(await resp, SubscribedMsg)
+        subscribed = check_message_response(resp, SubscribedMsg)
 
         sub_id = subscribed.subscription_id
-        _add_to_array(self.__sub_ids, topic_uri, sub_id)
-        self.__sub_handlers[sub_id] = callback, topic_uri
+        _add_to_set(self.__sub_ids, topic_uri, sub_id)
+        self.__sub_handlers[sub_id] = callback, topic_uri, inspect.iscoroutinefunction(callback)
 
         return sub_id
 
     async def __unsubscribe(self, sub_id: int) -> None:
-        with contextlib.suppress(KeyError):
-            del self.__sub_handlers[sub_id]
+        self.__sub_handlers.pop(sub_id, None)
 
         req_id = next(self.id_gen)
-        async with self._expecting_response(req_id) as resp:
-            await self.session.send(UnsubscribeMsg(req_id, sub_id))
-
-        check_message_response(await resp, UnsubscribedMsg)
+        resp = await self._request_response(req_id, UnsubscribeMsg(req_id, sub_id))
+        check_message_response(resp, UnsubscribedMsg)
 
     async def unsubscribe(self, topic: str, subscription_id: int = None) -> None:
         if subscription_id is None:
             try:
-                sub_ids = self.__procedure_ids.pop(topic)
+                sub_ids = self.__sub_ids.pop(topic)
             except KeyError:
                 raise KeyError(f"no subscription for {topic!r}") from None
 
-            await asyncio.gather(*(self.__unsubscribe(sub_id) for sub_id in sub_ids))
+            if len(sub_ids) == 1:
+                # the common case, a single request doesn't need to be batched.
+                sub_id, = sub_ids
+                await self.__unsubscribe(sub_id)
+                return
+
+            sub_handlers = self.__sub_handlers
+            for sub_id in sub_ids:
+                sub_handlers.pop(sub_id, None)
+
+            id_gen = self.id_gen
+            resps = await self._request_response_many([UnsubscribeMsg(next(id_gen), sub_id) for sub_id in sub_ids])
+            for resp in resps:
+                check_message_response(resp, UnsubscribedMsg)
+
             return
 
-        if subscription_id not in self.__procedures:
+        if subscription_id not in self.__sub_handlers:
             raise KeyError(f"unknown subscription id {subscription_id!r}")
 
-        with contextlib.suppress(KeyError, ValueError):
-            self.__sub_ids[topic].remove(subscription_id)
+        _remove_from_set(self.__sub_ids, topic, subscription_id)
 
         await self.__unsubscribe(subscription_id)
 
@@ -707,59 +776,95 @@ class Client(ClientABC):
                       disclose_me: bool = None,
                       resource_key: str = None,
                       options: aiowamp.WAMPDict = None) -> None:
-        if acknowledge is not None:
-            options = _set_value(options, "acknowledge", acknowledge)
+        if (acknowledge is not None or exclude_me is not None
+                or disclose_me is not None or resource_key is not None):
+            if options is None:
+                options = {}
 
-        if blackwhitelist:
-            options = blackwhitelist.to_options(options)
+            if acknowledge is not None:
+                options["acknowledge"] = acknowledge
 
-        if exclude_me is not None:
-            options = _set_value(options, "exclude_me", exclude_me)
+            if exclude_me is not None:
+                options["exclude_me"] = exclude_me
 
-        if disclose_me is not None:
-            options = _set_value(options, "disclose_me", disclose_me)
+            if disclose_me is not None:
+                options["disclose_me"] = disclose_me
 
-        if resource_key is not None:
-            options = _set_value(options, "rkey", resource_key)
+            if resource_key is not None:
+                options["rkey"] = resource_key
+
+        if blackwhitelist:
+            options = blackwhitelist.to_options(options)
 
         req_id = next(self.id_gen)
-        send_coro = self.session.send(PublishMsg(
+        publish_msg = PublishMsg(
             req_id,
-            options or {},
-            topic,
-            list(args) or None,
-            kwargs,
-        ))
+            options or EMPTY_OPTIONS,
+            _uri(topic),
+            list(args) if args else None,
+            kwargs or None,
+        )
 
         # don't wait for a response when acknowledge=False
         # because the router won't send one.
         if not acknowledge:
-            await send_coro
+            await self.session.send(publish_msg)
             return
 
         # wait for acknowledgment.
+        resp = await self._request_response(req_id, publish_msg)
+        check_message_response(resp, PublishedMsg)
 
-        async with self._expecting_response(req_id) as resp:
-            await send_coro
 
-        check_message_response(await resp, PublishedMsg)
+def _uri(uri: str) -> aiowamp.URI:
+    """Cast the string to a URI.
 
+    URIs for plain strings are cached so that recurring topics and procedures
+    don't create a new URI each time.
+    """
+    if isinstance(uri, URI):
+        return uri
+
+    return _cached_uri(uri)
+
+
+class _CachedURI(URI):
+    """URI without a match policy which is shared by the URI cache.
+
+    The URI ends up in messages, events and invocations of every caller, so
+    it can't be modified.
+    """
+    __slots__ = ()
+
+    def __new__(cls, uri: str) -> _CachedURI:
+        self = str.__new__(cls, uri)
+        # bypass __setattr__ to initialise the slot.
+        object.__setattr__(self, "match_policy", None)
+        return self
 
-T = TypeVar("T")
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__qualname__} is shared and can't be modified")
 
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__qualname__} is shared and can't be modified")
 
-def _set_value(d: Optional[T], key: str, value: aiowamp.WAMPType) -> T:
-    if d is None:
-        d = {}
 
-    d[key] = value
-    return d
+@functools.lru_cache(maxsize=4096)
+def _cached_uri(uri: str) -> aiowamp.URI:
+    # must only be called with plain strings. URIs compare equal to strings,
+    # so a URI with a match policy would end up in the cache otherwise.
+    return _CachedURI(uri)
 
 
-def _add_to_array(d: MutableMapping[str, array.ArrayType], key: str, value: int) -> None:
-    try:
-        a = d[key]
-    except KeyError:
-        d[key] = array.array("Q", (value,))
+def _add_to_set(d: MutableMapping[str, Set[int]], key: str, value: int) -> None:
+    s = d.get(key)
+    if s is None:
+        d[key] = {value}
     else:
-        a.append(value)
+        s.add(value)
+
+
+def _remove_from_set(d: MutableMapping[str, Set[int]], key: str, value: int) -> None:
+    s = d.get(key)
+    if s is not None:
+        s.discard(value)
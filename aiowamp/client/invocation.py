@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import abc
-import contextlib
 import datetime
 import logging
 import time
@@ -15,6 +14,7 @@ from aiowamp.args_mixin import ArgsMixin
 from aiowamp.msg import Error as ErrorMsg, Invocation as InvocationMsg, Yield as YieldMsg
 from aiowamp.uri import INVALID_ARGUMENT
 from .enum import CANCEL_KILL_NO_WAIT
+from .utils import EMPTY_OPTIONS
 
 __all__ = ["InvocationABC", "Invocation",
            "InvocationResult", "InvocationProgress"]
@@ -25,9 +25,25 @@ ClientT = TypeVar("ClientT", bound="aiowamp.ClientABC")
 
 
 class InvocationABC(ArgsMixin, abc.ABC, Generic[ClientT]):
-    """Invocation context passed to a procedure."""
+    """Invocation context passed to a procedure.
+
+    Subclasses are expected to provide the data attributes `request_id`,
+    `args`, `kwargs` and `details` (ex: as slots).
+    """
     __slots__ = ()
 
+    request_id: int
+    """ID of the invocation."""
+
+    args: Tuple[aiowamp.WAMPType, ...]
+    """Call arguments."""
+
+    kwargs: aiowamp.WAMPDict
+    """Call keyword arguments."""
+
+    details: aiowamp.WAMPDict
+    """Additional call details."""
+
     def __str__(self) -> str:
         return f"{type(self).__qualname__} {self.request_id}"
 
@@ -37,12 +53,6 @@ class InvocationABC(ArgsMixin, abc.ABC, Generic[ClientT]):
         """Underlying client that received the invocation."""
         ...
 
-    @property
-    @abc.abstractmethod
-    def request_id(self) -> int:
-        """ID of the invocation."""
-        ...
-
     @property
     @abc.abstractmethod
     def registered_procedure(self) -> aiowamp.URI:
@@ -64,24 +74,6 @@ class InvocationABC(ArgsMixin, abc.ABC, Generic[ClientT]):
         except KeyError:
             return self.registered_procedure
 
-    @property
-    @abc.abstractmethod
-    def args(self) -> Tuple[aiowamp.WAMPType, ...]:
-        """Call arguments."""
-        ...
-
-    @property
-    @abc.abstractmethod
-    def kwargs(self) -> aiowamp.WAMPDict:
-        """Call keyword arguments."""
-        ...
-
-    @property
-    @abc.abstractmethod
-    def details(self) -> aiowamp.WAMPDict:
-        """Additional call details."""
-        ...
-
     @property
     def may_send_progress(self) -> bool:
         """Whether or not the caller is willing to receive progressive results."""
@@ -215,11 +207,12 @@ class InvocationABC(ArgsMixin, abc.ABC, Generic[ClientT]):
 
 class Invocation(InvocationABC[ClientT], Generic[ClientT]):
     __slots__ = ("session",
+                 "request_id", "args", "kwargs", "details",
                  "__client",
                  "__timeout", "__timeout_at",
                  "__done", "__interrupt",
-                 "__procedure", "__request_id",
-                 "__args", "__kwargs", "__details")
+                 "__procedure", "__str",
+                 "__may_send_progress", "__caller_id", "__trust_level")
 
     session: aiowamp.SessionABC
     """Session used to send messages."""
@@ -230,11 +223,11 @@ class Invocation(InvocationABC[ClientT], Generic[ClientT]):
     __interrupt: Optional[aiowamp.Interrupt]
 
     __procedure: aiowamp.URI
-    __request_id: int
+    __str: str
 
-    __args: Tuple[aiowamp.WAMPType, ...]
-    __kwargs: aiowamp.WAMPDict
-    __details: aiowamp.WAMPDict
+    __may_send_progress: bool
+    __caller_id: Optional[int]
+    __trust_level: Optional[int]
 
     def __init__(self, session: aiowamp.SessionABC, client: ClientT, msg: aiowamp.msg.Invocation, *,
                  procedure: aiowamp.URI) -> None:
@@ -256,16 +249,21 @@ class Invocation(InvocationABC[ClientT], Generic[ClientT]):
         self.__interrupt = None
 
         self.__procedure = procedure
-        self.__request_id = msg.request_id
 
-        self.__args = tuple(msg.args) if msg.args else ()
-        self.__kwargs = msg.kwargs or {}
-        self.__details = msg.details
+        self.request_id = msg.request_id
+        # the string is used by the log messages
+        self.__str = f"{type(self).__qualname__} {msg.request_id}"
+        self.args = tuple(msg.args) if msg.args else ()
+        self.kwargs = msg.kwargs or {}
+        self.details = details = msg.details
 
-        try:
-            self.__timeout = self.__details["timeout"] / 1e3
-        except KeyError:
-            self.__timeout = 0
+        # values derived from the details are computed once up front.
+        self.__may_send_progress = bool(details.get("receive_progress", False))
+        self.__caller_id = details.get("caller")
+        self.__trust_level = details.get("trustlevel")
+
+        timeout = details.get("timeout")
+        self.__timeout = timeout / 1e3 if timeout is not None else 0
 
         # the default is 0 which means no timeout
         if self.__timeout:
@@ -274,6 +272,9 @@ class Invocation(InvocationABC[ClientT], Generic[ClientT]):
         else:
             self.__timeout_at = None
 
+    def __str__(self) -> str:
+        return self.__str
+
     def __getitem__(self, key: Union[int, str]) -> aiowamp.WAMPType:
         try:
             return super().__getitem__(key)
@@ -294,25 +295,21 @@ class Invocation(InvocationABC[ClientT], Generic[ClientT]):
     def client(self) -> ClientT:
         return self.__client
 
-    @property
-    def request_id(self) -> int:
-        return self.__request_id
-
     @property
     def registered_procedure(self) -> aiowamp.URI:
         return self.__procedure
 
     @property
-    def args(self) -> Tuple[aiowamp.WAMPType, ...]:
-        return self.__args
+    def may_send_progress(self) -> bool:
+        return self.__may_send_progress
 
     @property
-    def kwargs(self) -> aiowamp.WAMPDict:
-        return self.__kwargs
+    def caller_id(self) -> Optional[int]:
+        return self.__caller_id
 
     @property
-    def details(self) -> aiowamp.WAMPDict:
-        return self.__details
+    def trust_level(self) -> Optional[int]:
+        return self.__trust_level
 
     @property
     def timeout(self) -> float:
@@ -354,10 +351,10 @@ class Invocation(InvocationABC[ClientT], Generic[ClientT]):
         options["progress"] = True
 
         await self.session.send(YieldMsg(
-            self.__request_id,
+            self.request_id,
             options,
-            list(args) or None,
-            kwargs,
+            list(args) if args else None,
+            kwargs or None,
         ))
 
     async def send_result(self, *args: aiowamp.WAMPType,
@@ -367,16 +364,15 @@ class Invocation(InvocationABC[ClientT], Generic[ClientT]):
 
         if options:
             # make sure we're not accidentally sending a result with progress=True
-            with contextlib.suppress(KeyError):
-                del options["progress"]
+            options.pop("progress", None)
         else:
-            options = {}
+            options = EMPTY_OPTIONS
 
         await self.session.send(YieldMsg(
-            self.__request_id,
+            self.request_id,
             options,
-            list(args) or None,
-            kwargs,
+            list(args) if args else None,
+            kwargs or None,
         ))
 
     async def send_error(self, error: str, *args: aiowamp.WAMPType,
@@ -386,11 +382,11 @@ class Invocation(InvocationABC[ClientT], Generic[ClientT]):
 
         await self.session.send(ErrorMsg(
             InvocationMsg.message_type,
-            self.__request_id,
-            details or {},
+            self.request_id,
+            details or EMPTY_OPTIONS,
             error,
-            list(args) or None,
-            kwargs,
+            list(args) if args else None,
+            kwargs or None,
         ))
 
     def _cancel(self) -> None:
@@ -412,7 +408,7 @@ class InvocationResult(ArgsMixin):
     """
 
     __slots__ = ("args", "kwargs",
-                 "details")
+                 "__details")
 
     args: Tuple[aiowamp.WAMPType, ...]
     """Arguments."""
@@ -420,14 +416,29 @@ class InvocationResult(ArgsMixin):
     kwargs: aiowamp.WAMPDict
     """Keyword arguments."""
 
-    details: aiowamp.WAMPDict
-    """Details."""
+    __details: Optional[aiowamp.WAMPDict]
 
     def __init__(self, *args: aiowamp.WAMPType, **kwargs: aiowamp.WAMPType) -> None:
         self.args = args
         self.kwargs = kwargs
 
-        self.details = {}
+        self.__details = None
+
+    @property
+    def details(self) -> aiowamp.WAMPDict:
+        """Details.
+
+        The dict is only created when it's first accessed.
+        """
+        details = self.__details
+        if details is None:
+            details = self.__details = {}
+
+        return details
+
+    @details.setter
+    def details(self, details: aiowamp.WAMPDict) -> None:
+        self.__details = details
 
 
 class InvocationProgress(InvocationResult):
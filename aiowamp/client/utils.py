@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Type, TypeVar
+from typing import Type, TypeVar, cast
 
 import aiowamp
-from aiowamp import UnexpectedMessageError, error_to_exception, message_as_type
+from aiowamp import UnexpectedMessageError, error_to_exception
 from aiowamp.msg import Error as ErrorMsg
 
 __all__ = ["check_message_response"]
 
 MsgT = TypeVar("MsgT", bound="aiowamp.MessageABC")
 
+_ERROR_TYPE = ErrorMsg.message_type
+
+EMPTY_OPTIONS: aiowamp.WAMPDict = {}
+"""Shared options dict for outgoing messages without options.
+
+Also used for empty details. MUST NOT be mutated. Not used for call messages
+because `aiowamp.Call` adds options to its message.
+"""
+
 
 def check_message_response(msg: aiowamp.MessageABC, ok_type: Type[MsgT]) -> MsgT:
     """Assert that a message has a given type.
@@ -29,12 +38,13 @@ def check_message_response(msg: aiowamp.MessageABC, ok_type: Type[MsgT]) -> MsgT
             message type.
         Exception: If the message is an `aiowamp.msg.Error`.
     """
-    ok = message_as_type(msg, ok_type)
-    if ok:
-        return ok
-
-    error = message_as_type(msg, ErrorMsg)
-    if error:
-        raise error_to_exception(error)
+    # compare the message types directly instead of using message_as_type,
+    # this is called for every response.
+    msg_type = msg.message_type
+    if msg_type == ok_type.message_type:
+        return cast(MsgT, msg)
+
+    if msg_type == _ERROR_TYPE:
+        raise error_to_exception(cast(ErrorMsg, msg))
 
     raise UnexpectedMessageError(msg, ok_type)
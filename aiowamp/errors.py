@@ -239,8 +239,7 @@ def exception_to_invocation_error(exc: Exception) -> InvocationError:
     try:
         uri = get_exception_uri(type(exc))
     except LookupError:
-        log.info(f"no uri registered for exception {type(exc).__qualname__}. "
-                 f"Using {RUNTIME_ERROR!r}")
+        log.info("no uri registered for exception %s. Using %r", type(exc).__qualname__, RUNTIME_ERROR)
         uri = RUNTIME_ERROR
 
     return InvocationError(uri, *exc.args)
@@ -0,0 +1,35 @@
+"""Provides helpers for the event loop aiowamp runs in."""
+
+import asyncio
+import logging
+
+__all__ = ["install_uvloop"]
+
+log = logging.getLogger(__name__)
+
+
+def install_uvloop() -> bool:
+    """Use uvloop for all event loops created from now on.
+
+    uvloop is a drop-in replacement for the built-in asyncio event loop which
+    is implemented on top of libuv. It considerably speeds up the socket I/O
+    the transports perform.
+
+    uvloop is an optional dependency, it can be installed using the "uvloop"
+    extra (i.e. `pip install aiowamp[uvloop]`).
+
+    This sets the event loop policy, so it has to be called before the event
+    loop is created (ex: before `asyncio.run`). It doesn't affect a loop which
+    is already running.
+
+    Returns:
+        Whether uvloop was installed. `False` if uvloop isn't available.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        log.debug("uvloop isn't available, using the default event loop")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
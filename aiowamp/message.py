@@ -38,6 +38,13 @@ class MessageABC(abc.ABC):
     message_type: ClassVar[int]
     """Type code of the message."""
 
+    request_id: Optional[int] = None
+    """Request id of the message.
+
+    `None` for messages which don't carry a request id. This allows checking
+    for a request id using plain attribute access.
+    """
+
     def __str__(self) -> str:
         return f"{self.message_type} {type(self).__qualname__}"
 
@@ -110,7 +117,8 @@ def message_as_type(msg: aiowamp.MessageABC, msg_type: Type[MsgT]) -> Optional[M
         >>> hello_msg is msg
         True
     """
-    if is_message_type(msg, msg_type):
+    # same as is_message_type, inlined because this is used on hot paths.
+    if msg.message_type == msg_type.message_type:
         return cast(MsgT, msg)
 
     return None
@@ -91,6 +91,10 @@ class Attr:
         return f"\"{self.name}\""
 
     def convert(self, obj: str) -> str:
+        if self.cls == "URI":
+            # don't create a new uri if obj already is one
+            return f"{self.cls}.cast({obj})"
+
         if self.cls is not None:
             return f"{self.cls}({obj})"
 
@@ -7,11 +7,22 @@ __all__ = ["MessagePackSerializer"]
 
 
 class MessagePackSerializer(SerializerABC):
-    __slots__ = ()
+    __slots__ = ("packer",)
+
+    packer: msgpack.Packer
+    """Packer used to serialise outgoing messages.
+
+    The packer is reused for all messages instead of creating a new one for
+    each message.
+    """
+
+    def __init__(self) -> None:
+        self.packer = msgpack.Packer()
 
     def serialize(self, msg: aiowamp.MessageABC) -> bytes:
-        return msgpack.packb(msg.to_message_list())
+        return self.packer.pack(msg.to_message_list())
 
     def deserialize(self, data: bytes) -> aiowamp.MessageABC:
         msg_list = msgpack.unpackb(data)
         return build_message_from_list(msg_list)
+
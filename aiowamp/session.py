@@ -3,7 +3,7 @@ from __future__ import annotations
 import abc
 import asyncio
 import logging
-from typing import Any, Callable, Dict, List, Optional, Set, Awaitable
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
 
 import aiowamp
 from .maybe_awaitable import MaybeAwaitable, call_async_fn_background
@@ -64,10 +64,21 @@ class SessionABC(abc.ABC):
         ...
 
     @abc.abstractmethod
-    async def send(self, msg: aiowamp.MessageABC) -> None:
-        """Send a message using the underlying transport."""
+    def send(self, msg: aiowamp.MessageABC) -> Awaitable[None]:
+        """Send a message using the underlying transport.
+
+        Implementations may be coroutine functions, or return the transport's
+        awaitable directly.
+        """
         ...
 
+    def send_many(self, msgs: Iterable[aiowamp.MessageABC]) -> Awaitable[None]:
+        """Send multiple messages using the underlying transport.
+
+        The default implementation sends the messages one by one.
+        """
+        return _send_one_by_one(self, msgs)
+
     @abc.abstractmethod
     async def wait_until_done(self) -> Optional[aiowamp.msg.Goodbye]:
         ...
@@ -91,6 +102,11 @@ class SessionABC(abc.ABC):
         return feature in self.get_features(role)
 
 
+async def _send_one_by_one(session: aiowamp.SessionABC, msgs: Iterable[aiowamp.MessageABC]) -> None:
+    for msg in msgs:
+        await session.send(msg)
+
+
 class Session(SessionABC):
     __slots__ = ("transport",
                  "control_transport",
@@ -187,7 +203,7 @@ class Session(SessionABC):
         # remote initiated goodbye
         if not self.__goodbye_fut:
             if goodbye.reason == GOODBYE_AND_OUT:
-                log.warning(f"received {goodbye} confirmation before closing.")
+                log.warning("received %s confirmation before closing.", goodbye)
 
             await self.send(GoodbyeMsg(
                 {},
@@ -215,8 +231,14 @@ class Session(SessionABC):
 
         log.debug("%s: exiting receive loop", self)
 
-    async def send(self, msg: aiowamp.MessageABC) -> None:
-        await self.transport.send(msg)
+    # send and send_many return the transport's awaitable directly instead of
+    # wrapping it in another coroutine.
+
+    def send(self, msg: aiowamp.MessageABC) -> Awaitable[None]:
+        return self.transport.send(msg)
+
+    def send_many(self, msgs: Iterable[aiowamp.MessageABC]) -> Awaitable[None]:
+        return self.transport.send_many(msgs)
 
     async def close(self, details: aiowamp.WAMPDict = None, *,
                     reason: aiowamp.URI = None) -> None:
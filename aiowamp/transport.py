@@ -4,7 +4,7 @@ import abc
 import dataclasses
 import ssl
 import urllib.parse as urlparse
-from typing import Awaitable, Callable, Dict, Optional
+from typing import Awaitable, Callable, Dict, Iterable, Optional
 
 import aiowamp
 
@@ -49,6 +49,18 @@ class TransportABC(abc.ABC):
         """
         ...
 
+    async def send_many(self, msgs: Iterable[aiowamp.MessageABC]) -> None:
+        """Send multiple messages.
+
+        Transports which can write multiple messages at once should override
+        this. The default implementation sends the messages one by one.
+
+        Args:
+            msgs: Messages to send in order.
+        """
+        for msg in msgs:
+            await self.send(msg)
+
     @abc.abstractmethod
     async def recv(self) -> aiowamp.MessageABC:
         """Receive a message.
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import ssl
 import urllib.parse as urlparse
-from typing import Dict, Optional, Type, Union, overload
+from typing import Dict, Iterable, Optional, Type, Union, overload
 
 import aiowamp
 from aiowamp import CommonTransportConfig, JSONSerializer, MessagePackSerializer, TransportABC, TransportError, \
@@ -113,6 +113,23 @@ class RawSocketTransport(TransportABC):
         self.writer.write(data)
         await self.writer.drain()
 
+    async def send_many(self, msgs: Iterable[aiowamp.MessageABC]) -> None:
+        chunks = []
+        for msg in msgs:
+            log.debug("%s: sending: %r", self, msg)
+
+            data = self.serializer.serialize(msg)
+            if len(data) > self.__send_limit:
+                raise TransportError("message longer than remote is willing to receive")
+
+            chunks.append(b"\x00" + int_to_bytes(len(data)))
+            chunks.append(data)
+
+        # only write once all messages were serialised so that a single
+        # faulty message doesn't result in a partial write.
+        self.writer.writelines(chunks)
+        await self.writer.drain()
+
     async def __read_once(self) -> None:
         assert self._msg_queue
 
@@ -20,6 +20,9 @@ setuptools.setup(
         "msgpack",
         "websockets",
     ],
+    extras_require={
+        "uvloop": ["uvloop"],
+    },
 
     packages=setuptools.find_packages(exclude=("docs", "examples", "tests")),
     package_data={
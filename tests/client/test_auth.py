@@ -0,0 +1,34 @@
+import base64
+import hashlib
+import hmac
+
+import pytest
+
+import aiowamp
+
+pytestmark = pytest.mark.asyncio
+
+
+def sign(key: bytes, challenge: str) -> str:
+    return base64.b64encode(hmac.digest(key, challenge.encode(), hashlib.sha256)).decode()
+
+
+async def test_cra_auth():
+    auth = aiowamp.CRAuth("secret")
+
+    msg = await auth.authenticate(aiowamp.msg.Challenge("wampcra", {"challenge": "hello"}))
+    assert msg.signature == sign(b"secret", "hello")
+
+
+async def test_cra_auth_salted():
+    auth = aiowamp.CRAuth("secret")
+    key = base64.b64encode(hashlib.pbkdf2_hmac("sha256", b"secret", b"salt", 100, 32))
+
+    msg = await auth.authenticate(aiowamp.msg.Challenge("wampcra", {
+        "challenge": "hello",
+        "salt": "salt",
+        "iterations": 100,
+        "keylen": 32,
+    }))
+    assert msg.signature == sign(key, "hello")
+    assert auth.pbkdf2_hmac("salt", 100, 32) == key
@@ -1,3 +1,5 @@
+import pytest
+
 import aiowamp
 
 
@@ -13,3 +15,52 @@ def test_bwlist():
     assert 9912315 in bwlist
     assert 7891255 not in bwlist
     assert 5555 not in bwlist
+
+
+def test_bwlist_mutate():
+    bwlist = aiowamp.BlackWhiteList()
+    assert not bwlist
+
+    bwlist.exclude_session_id(5)
+    bwlist.exclude_session_id(3)
+    bwlist.exclude_session_id(5)
+    bwlist.allow_auth_role("admin")
+    assert bwlist
+    assert 5 not in bwlist
+    assert "admin" in bwlist
+
+    assert bwlist.to_options() == {"exclude": [3, 5], "eligible_authrole": ["admin"]}
+
+    bwlist.unexclude(5)
+    assert 5 in bwlist
+    assert bwlist.to_options()["exclude"] == [3]
+    bwlist.disallow("admin")
+
+    with pytest.raises(ValueError):
+        bwlist.unexclude(5)
+    with pytest.raises(ValueError):
+        bwlist.disallow("admin")
+    with pytest.raises(ValueError):
+        bwlist.disallow(1)
+
+
+def test_bwlist_options():
+    options = {"exclude": [3, 1, 3], "eligible_authid": ["b", "a"]}
+    bwlist = aiowamp.BlackWhiteList.from_options(options)
+    assert bwlist.to_options() == {"exclude": [1, 3], "eligible_authid": ["a", "b"]}
+
+    bwlist.excluded_ids.add(2)
+    assert bwlist.to_options({"acknowledge": True}) == {"acknowledge": True,
+                                                        "exclude": [1, 2, 3], "eligible_authid": ["a", "b"]}
+
+
+def test_bwlist_contains_matches_checks():
+    bwlist = aiowamp.BlackWhiteList(excluded_ids=[1], excluded_auth_ids=["a"],
+                                    eligible_ids=[1, 2], eligible_auth_roles=["r", "a"])
+
+    for receiver in (1, 2, 3, "a", "r", "x"):
+        expected = bwlist.is_eligible(receiver) and not bwlist.is_excluded(receiver)
+        assert (receiver in bwlist) is expected
+
+    bwlist.excluded_ids = {4}
+    assert bwlist.to_options()["exclude"] == [4]
@@ -0,0 +1,172 @@
+import asyncio
+from typing import Callable
+
+import pytest
+
+import aiowamp
+from aiowamp.client import client as client_module
+from tests import mock
+
+pytestmark = pytest.mark.asyncio
+
+
+def respond(client: aiowamp.Client, build: Callable[[aiowamp.MessageABC], aiowamp.MessageABC]) -> asyncio.Task:
+    async def responder() -> None:
+        msg = await mock.get_next_message(client)
+        await client._Client__handle_message(build(msg))
+
+    return asyncio.create_task(responder())
+
+
+async def test_subscribe():
+    client = mock.make_dummy_client()
+    events = []
+
+    respond(client, lambda msg: aiowamp.msg.Subscribed(msg.request_id, 5))
+    sub_id = await client.subscribe("topic", events.append)
+    assert sub_id == 5
+    assert client.get_subscription_ids("topic") == (5,)
+
+    await client._Client__handle_message(aiowamp.msg.Event(5, 1, {}, ["hello"]))
+    assert len(events) == 1
+    assert events[0].args == ("hello",)
+    assert events[0].subscribed_topic == "topic"
+
+
+async def test_unsubscribe():
+    client = mock.make_dummy_client()
+
+    for sub_id in (5, 6):
+        respond(client, lambda msg, sub_id=sub_id: aiowamp.msg.Subscribed(msg.request_id, sub_id))
+        await client.subscribe("topic", lambda event: None)
+
+    respond(client, lambda msg: aiowamp.msg.Unsubscribed(msg.request_id))
+    await client.unsubscribe("topic", 5)
+    assert client.get_subscription_ids("topic") == (6,)
+
+    with pytest.raises(KeyError):
+        await client.unsubscribe("topic", 5)
+
+    respond(client, lambda msg: aiowamp.msg.Unsubscribed(msg.request_id))
+    await client.unsubscribe("topic")
+    assert client.get_subscription_ids("topic") == ()
+
+    with pytest.raises(KeyError):
+        await client.unsubscribe("topic")
+
+
+async def test_unsubscribe_many():
+    client = mock.make_dummy_client()
+
+    for sub_id in (5, 6):
+        respond(client, lambda msg, sub_id=sub_id: aiowamp.msg.Subscribed(msg.request_id, sub_id))
+        await client.subscribe("topic", lambda event: None)
+
+    async def responder() -> None:
+        msgs = [await mock.get_next_message(client) for _ in range(2)]
+        assert {msg.subscription_id for msg in msgs} == {5, 6}
+
+        for msg in reversed(msgs):
+            await client._Client__handle_message(aiowamp.msg.Unsubscribed(msg.request_id))
+
+    asyncio.create_task(responder())
+    await client.unsubscribe("topic")
+    assert client.get_subscription_ids("topic") == ()
+
+
+async def test_subscribe_async_handler():
+    client = mock.make_dummy_client()
+    events = []
+
+    async def handler(event):
+        events.append(event)
+
+    respond(client, lambda msg: aiowamp.msg.Subscribed(msg.request_id, 5))
+    await client.subscribe("topic", handler)
+
+    await client._Client__handle_message(aiowamp.msg.Event(5, 1, {}, ["hello"]))
+    assert len(events) == 1
+
+
+async def test_publish():
+    client = mock.make_dummy_client()
+
+    await client.publish("topic", "hello")
+    msg = await mock.get_next_message(client)
+    assert msg.topic == "topic"
+    assert msg.args == ["hello"]
+    assert msg.options == {}
+
+    respond(client, lambda msg: aiowamp.msg.Published(msg.request_id, 1))
+    await client.publish("topic", acknowledge=True)
+
+
+async def test_publish_order():
+    client = mock.make_dummy_client()
+
+    transport = mock.get_transport(client)
+    send = transport.send
+    drained = asyncio.Event()
+
+    async def send_and_drain(msg):
+        await send(msg)
+        await drained.wait()
+
+    transport.send = send_and_drain
+
+    publishes = asyncio.gather(
+        client.publish("topic", "A"),
+        client.publish("topic", "B"),
+        client.publish("topic", "C", acknowledge=True),
+    )
+    await asyncio.sleep(0)
+    drained.set()
+
+    msgs = mock.get_messages(client)
+    assert [msg.args[0] for msg in msgs] == ["A", "B", "C"]
+
+    await client._Client__handle_message(aiowamp.msg.Published(msgs[2].request_id, 1))
+    await publishes
+
+
+async def test_cached_uri():
+    uri = client_module._uri("topic")
+    assert uri is client_module._uri("topic")
+    assert uri.match_policy is None
+
+    with pytest.raises(AttributeError):
+        uri.match_policy = aiowamp.MATCH_PREFIX
+
+
+async def test_call():
+    client = mock.make_dummy_client()
+
+    respond(client, lambda msg: aiowamp.msg.Result(msg.request_id, {}, [msg.args[0] + msg.args[1]]))
+    result = await client.call("add", 1, 2)
+    assert result.args == (3,)
+
+    respond(client, lambda msg: aiowamp.msg.Error(aiowamp.msg.Call.message_type, msg.request_id, {},
+                                                  aiowamp.uri.RUNTIME_ERROR))
+    with pytest.raises(aiowamp.ErrorResponse):
+        await client.call("add", 1, 2)
+
+
+async def test_call_progress():
+    client = mock.make_dummy_client()
+    call = client.call("count")
+
+    async def responder() -> None:
+        msg = await mock.get_next_message(client)
+        assert msg.options["receive_progress"] is True
+
+        for i in range(3):
+            await client._Client__handle_message(aiowamp.msg.Result(msg.request_id, {"progress": True}, [i]))
+            await asyncio.sleep(0)
+
+        await client._Client__handle_message(aiowamp.msg.Result(msg.request_id, {}, ["done"]))
+
+    asyncio.create_task(responder())
+
+    progress = [p.args[0] async for p in call]
+    assert progress == [0, 1, 2]
+    assert (await call).args == ("done",)